@@ -9,13 +9,12 @@ from typing import (
     List,
     Mapping,
     Optional,
+    Sequence,
     Type,
     TypeVar,
     Union,
 )
 
-from cached_property import cached_property  # type: ignore
-
 from strawberry.annotation import StrawberryAnnotation
 from strawberry.arguments import UNSET, StrawberryArgument
 from strawberry.type import StrawberryType
@@ -29,8 +28,27 @@ from .types.types import FederationFieldParams, TypeDefinition
 
 _RESOLVER_TYPE = Union[StrawberryResolver, Callable]
 
+# Most fields don't use federation, they all share the same (empty) params
+# instead of creating new ones for each field, so these shouldn't be mutated
+_DEFAULT_FEDERATION = FederationFieldParams()
+
 
 class StrawberryField(dataclasses.Field, GraphQLNameMixin):
+    # dataclasses.Field uses slots, schemas can have lots of fields, so we
+    # use slots too to avoid creating a dict for each field
+    __slots__ = (
+        "graphql_name",
+        "type_annotation",
+        "description",
+        "origin",
+        "_base_resolver",
+        "default_value",
+        "is_subscription",
+        "federation",
+        "permission_classes",
+        "deprecation_reason",
+    )
+
     python_name: str
 
     def __init__(
@@ -43,12 +61,12 @@ class StrawberryField(dataclasses.Field, GraphQLNameMixin):
         federation: FederationFieldParams = None,
         description: Optional[str] = None,
         base_resolver: Optional[StrawberryResolver] = None,
-        permission_classes: List[Type[BasePermission]] = (),  # type: ignore
+        permission_classes: Sequence[Type[BasePermission]] = (),
         default: object = UNSET,
         default_factory: Union[Callable[[], Any], object] = UNSET,
         deprecation_reason: Optional[str] = None,
     ):
-        federation = federation or FederationFieldParams()
+        federation = federation or _DEFAULT_FEDERATION
 
         # basic fields are fields with no provided resolver
         is_basic_field = not base_resolver
@@ -66,12 +84,14 @@ class StrawberryField(dataclasses.Field, GraphQLNameMixin):
             repr=is_basic_field,
             compare=is_basic_field,
             hash=None,
-            metadata={},
+            metadata=None,  # type: ignore[arg-type]
         )
 
         self.graphql_name = graphql_name
         if python_name is not None:
-            self.python_name = python_name
+            # set the dataclass field name directly instead of going through
+            # the python_name property
+            self.name = python_name
 
         self.type_annotation = type_annotation
 
@@ -262,7 +282,7 @@ class StrawberryField(dataclasses.Field, GraphQLNameMixin):
     def _has_async_base_resolver(self) -> bool:
         return self.base_resolver is not None and self.base_resolver.is_async
 
-    @cached_property
+    @property
     def is_async(self) -> bool:
         return self._has_async_permission_classes or self._has_async_base_resolver
 
@@ -300,8 +320,8 @@ def field(
         type_annotation=None,
         description=description,
         is_subscription=is_subscription,
-        permission_classes=permission_classes or [],
-        federation=federation or FederationFieldParams(),
+        permission_classes=permission_classes or (),
+        federation=federation,
         deprecation_reason=deprecation_reason,
         default=default,
         default_factory=default_factory,
@@ -313,14 +313,16 @@ class GraphQLCoreConverter:
 
             args = []
 
-            if field.base_resolver:
-                if field.base_resolver.has_self_arg:
+            base_resolver = field.base_resolver
+
+            if base_resolver:
+                if base_resolver.has_self_arg:
                     args.append(source)
 
-                if field.base_resolver.has_root_arg:
+                if base_resolver.has_root_arg:
                     kwargs["root"] = source
 
-                if field.base_resolver.has_info_arg:
+                if base_resolver.has_info_arg:
                     kwargs["info"] = info
 
             return args, kwargs
@@ -26,22 +26,33 @@
 # SOFTWARE.
 
 import re
-from typing import Callable, Dict, List, Optional, Union
+import sys
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
 from graphql import GraphQLError
 from graphql.language import (
     DefinitionNode,
-    FieldNode,
     FragmentDefinitionNode,
-    FragmentSpreadNode,
     InlineFragmentNode,
     Node,
     OperationDefinitionNode,
+    SelectionNode,
 )
 from graphql.validation import ValidationContext, ValidationRule
 
-from strawberry.extensions.tracing.utils import is_instrospection_key
-
 
 IgnoreType = Union[Callable[[str], bool], re.Pattern, str]
 
@@ -50,7 +61,7 @@ def depth_limit_validator(
     max_depth: int,
     ignore: Optional[List[IgnoreType]] = None,
     callback: Callable[[Dict[str, int]], None] = None,
-):
+) -> Type[ValidationRule]:
     """
     Creates a validator for the GraphQL query depth
 
@@ -59,16 +70,78 @@ def depth_limit_validator(
         Either a string or regexp to match the name, or a function that returns
         a boolean.
     - callback - Called each time validation runs. Receives an Object which is a
-        map of the depths for each operation.
+        map of the depths for each operation. Operations that exceed the maximum
+        depth are reported with the depth at which checking stopped.
     """
 
+    ignore_rules = (
+        tuple(_IdentityKey(rule) if callable(rule) else rule for rule in ignore)
+        if ignore is not None
+        else None
+    )
+    key = (max_depth, ignore_rules, _IdentityKey(callback))
+
+    try:
+        hash(key)
+    except TypeError:
+        # unhashable rules can't be cached, build a new validator for them
+        return create_depth_limit_validator.__wrapped__(*key)  # type: ignore
+
+    return create_depth_limit_validator(*key)
+
+
+class _IdentityKey:
+    """
+    Wraps an object so that it's hashed and compared by identity, and keeps it
+    alive for as long as the key is used.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __hash__(self) -> int:
+        return id(self.value)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _IdentityKey) and other.value is self.value
+
+
+# Validators are usually created with the same configuration over and over
+# again (e.g. once per request), so we reuse the validator classes instead of
+# creating a new class every time. Functions (including the callback) are part
+# of the key by identity, as two different functions that compare equal can
+# still behave differently.
+@lru_cache(maxsize=32)
+def create_depth_limit_validator(
+    max_depth: int,
+    ignore_rules: Optional[Tuple[Union[IgnoreType, _IdentityKey], ...]],
+    callback_key: _IdentityKey,
+) -> Type[ValidationRule]:
+    ignore = (
+        [
+            rule.value if isinstance(rule, _IdentityKey) else rule
+            for rule in ignore_rules
+        ]
+        if ignore_rules is not None
+        else None
+    )
+    callback = callback_key.value
+
+    should_ignore = compile_ignore_rules(ignore)
+
     class DepthLimitValidator(ValidationRule):
         def __init__(self, validation_context: ValidationContext):
             document = validation_context.document
             definitions = document.definitions
 
-            fragments = get_fragments(definitions)
-            queries = get_queries_and_mutations(definitions)
+            fragments, queries = get_fragments_and_operations(definitions)
+            fragment_depths = get_fragment_depths(
+                fragments=fragments,
+                context=validation_context,
+                should_ignore=should_ignore,
+            )
             query_depths = {}
 
             for name in queries:
@@ -79,7 +152,8 @@ def depth_limit_validator(
                     max_depth=max_depth,
                     context=validation_context,
                     operation_name=name,
-                    ignore=ignore,
+                    should_ignore=should_ignore,
+                    fragment_depths=fragment_depths,
                 )
 
             if callable(callback):
@@ -89,30 +163,109 @@ def depth_limit_validator(
     return DepthLimitValidator
 
 
-def get_fragments(
+# Operations are both queries and mutations, we can basically treat those the
+# same
+def get_fragments_and_operations(
     definitions: List[DefinitionNode],
-) -> Dict[str, FragmentDefinitionNode]:
+) -> Tuple[Dict[str, FragmentDefinitionNode], Dict[str, OperationDefinitionNode]]:
     fragments = {}
+    operations = {}
+
     for definition in definitions:
         if isinstance(definition, FragmentDefinitionNode):
             fragments[definition.name.value] = definition
+        elif isinstance(definition, OperationDefinitionNode):
+            operation = definition.name.value if definition.name else "anonymous"
+            operations[operation] = definition
 
-    return fragments
+    return fragments, operations
 
 
-# This will actually get both queries and mutations.
-# We can basically treat those the same
-def get_queries_and_mutations(
-    definitions: List[DefinitionNode],
-) -> Dict[str, OperationDefinitionNode]:
-    operations = {}
+def get_fragment_depths(
+    fragments: Dict[str, FragmentDefinitionNode],
+    context: ValidationContext,
+    should_ignore: Optional[Callable[[str], bool]],
+) -> Dict[str, int]:
+    """
+    Returns the depth of each fragment, as if it was inlined at the top of an
+    operation.
 
-    for definition in definitions:
-        if isinstance(definition, OperationDefinitionNode):
-            operation = definition.name.value if definition.name else "anonymous"
-            operations[operation] = definition
+    Fragments are measured in topological order, so that the depths of the
+    fragments spread by a fragment are always known by the time it is measured,
+    and no fragment is walked more than once.
+    Fragments that are part of a cycle are left out, they are reported by the
+    NoFragmentCyclesRule.
+    """
+
+    dependencies: Dict[str, int] = {}
+    dependents: Dict[str, List[str]] = {name: [] for name in fragments}
+
+    for name, fragment in fragments.items():
+        spread_names = {
+            spread.name.value
+            for spread in context.get_fragment_spreads(fragment.selection_set)
+        }
+        # unknown fragments are reported by the KnownFragmentNamesRule
+        spread_names.intersection_update(fragments)
 
-    return operations
+        dependencies[name] = len(spread_names)
+        for spread_name in spread_names:
+            dependents[spread_name].append(name)
+
+    ready = [name for name, count in dependencies.items() if count == 0]
+    fragment_depths: Dict[str, int] = {}
+
+    while ready:
+        name = ready.pop()
+        fragment_depths[name] = determine_depth(
+            node=fragments[name],
+            fragments=fragments,
+            depth_so_far=0,
+            max_depth=sys.maxsize,
+            context=context,
+            operation_name=name,
+            should_ignore=should_ignore,
+            fragment_depths=fragment_depths,
+        )
+
+        for dependent in dependents[name]:
+            dependencies[dependent] -= 1
+            if dependencies[dependent] == 0:
+                ready.append(dependent)
+
+    return fragment_depths
+
+
+# Kinds of the nodes that don't add any depth to their selections
+_COMPOSITE_KINDS = frozenset(
+    (
+        InlineFragmentNode.kind,
+        FragmentDefinitionNode.kind,
+        OperationDefinitionNode.kind,
+    )
+)
+
+
+class _Frame:
+    """
+    A node with a selection set that is being walked by determine_depth: the
+    selections left to visit, the depth they are at and the deepest of the
+    selections visited so far.
+    """
+
+    # there's a frame for every node with a selection set, so avoid creating a
+    # dict for each of them
+    __slots__ = ("selections", "depth_so_far", "offset", "max_child_depth")
+
+    def __init__(
+        self, selections: Iterator[SelectionNode], depth_so_far: int, offset: int
+    ):
+        self.selections = selections
+        self.depth_so_far = depth_so_far
+        # fields count as one level on top of their children, fragments and
+        # operations don't
+        self.offset = offset
+        self.max_child_depth = 0
 
 
 def determine_depth(
@@ -122,87 +275,141 @@ def determine_depth(
     max_depth: int,
     context: ValidationContext,
     operation_name: str,
-    ignore: Optional[List[IgnoreType]] = None,
+    should_ignore: Optional[Callable[[str], bool]],
+    fragment_depths: Optional[Dict[str, int]] = None,
 ) -> int:
-    if depth_so_far > max_depth:
-        context.report_error(
-            GraphQLError(
-                f"'{operation_name}' exceeds maximum operation depth of {max_depth}",
-                [node],
-            )
-        )
-        return depth_so_far
+    if fragment_depths is None:
+        fragment_depths = get_fragment_depths(fragments, context, should_ignore)
 
-    if isinstance(node, FieldNode):
-        # by default, ignore the introspection fields which begin with double underscores
-        should_ignore = is_instrospection_key(node.name.value) or is_ignored(
-            node, ignore
-        )
+    # The document is walked with an explicit stack instead of recursion, as
+    # deep (or fragment heavy) documents would otherwise create one Python
+    # frame per node.
+    stack: List[_Frame] = []
 
-        if should_ignore or not node.selection_set:
-            return 0
+    # The loop below runs for every node of the document, so the globals and
+    # methods it uses are bound to locals to avoid looking them up every time
+    push = stack.append
+    pop = stack.pop
+    new_frame = _Frame
+    composite_kinds = _COMPOSITE_KINDS
 
-        return 1 + max(
-            map(
-                lambda selection: determine_depth(
-                    node=selection,
-                    fragments=fragments,
-                    depth_so_far=depth_so_far + 1,
-                    max_depth=max_depth,
-                    context=context,
-                    operation_name=operation_name,
-                    ignore=ignore,
-                ),
-                node.selection_set.selections,
-            )
-        )
-    elif isinstance(node, FragmentSpreadNode):
-        return determine_depth(
-            node=fragments[node.name.value],
-            fragments=fragments,
-            depth_so_far=depth_so_far,
-            max_depth=max_depth,
-            context=context,
-            operation_name=operation_name,
-            ignore=ignore,
-        )
-    elif isinstance(
-        node, (InlineFragmentNode, FragmentDefinitionNode, OperationDefinitionNode)
-    ):
-        return max(
-            map(
-                lambda selection: determine_depth(
-                    node=selection,
-                    fragments=fragments,
-                    depth_so_far=depth_so_far,
-                    max_depth=max_depth,
-                    context=context,
-                    operation_name=operation_name,
-                    ignore=ignore,
-                ),
-                node.selection_set.selections,
+    # nodes are told apart by their kind, which mypy can't narrow types with
+    current: Any = node
+
+    while True:
+        depth: Optional[int] = None
+
+        if depth_so_far > max_depth:
+            context.report_error(
+                GraphQLError(
+                    f"'{operation_name}' exceeds maximum operation depth of {max_depth}",
+                    [current],
+                )
             )
-        )
-    else:
-        raise Exception(f"Depth crawler cannot handle: {node.kind}")  # pragma: no cover
+            # there's no need to look any further once the operation is known
+            # to be too deep
+            return depth_so_far
+
+        # dispatching on the kind of the node is cheaper than isinstance checks
+        kind = current.kind
+
+        if kind == "field":
+            field_name = current.name.value
+
+            # by default, ignore the introspection fields which begin with double
+            # underscores
+            if (
+                field_name[:2] == "__"
+                or (should_ignore is not None and should_ignore(field_name))
+                or not current.selection_set
+            ):
+                depth = 0
+            else:
+                push(
+                    new_frame(
+                        iter(current.selection_set.selections), depth_so_far + 1, 1
+                    )
+                )
+        elif kind == "fragment_spread":
+            # unknown and cyclic fragments don't have a depth, other rules
+            # report those
+            fragment_depth = fragment_depths.get(current.name.value, 0)
+
+            if depth_so_far + fragment_depth <= max_depth:
+                depth = fragment_depth
+            else:
+                # only walk the fragment when it makes the operation too deep,
+                # to report the error on the node that exceeds the maximum depth
+                fragment = fragments[current.name.value]
+                push(
+                    new_frame(iter(fragment.selection_set.selections), depth_so_far, 0)
+                )
+        elif kind in composite_kinds:
+            push(new_frame(iter(current.selection_set.selections), depth_so_far, 0))
+        else:
+            raise Exception(f"Depth crawler cannot handle: {kind}")  # pragma: no cover
+
+        # Pass the depth of the node we just finished up the stack, finishing
+        # every frame that has no selections left, until we find the next node
+        # to visit. Each frame keeps a running maximum of the depths of its
+        # selections, so there's nothing to collect and pass to max() later.
+        while True:
+            if depth is None:
+                frame = stack[-1]
+            else:
+                if not stack:
+                    return depth
+
+                frame = stack[-1]
+                if depth > frame.max_child_depth:
+                    frame.max_child_depth = depth
 
+            selection = next(frame.selections, None)
 
-def is_ignored(node: FieldNode, ignore: Optional[List[IgnoreType]] = None) -> bool:
-    if ignore is None:
-        return False
+            if selection is not None:
+                current = selection
+                depth_so_far = frame.depth_so_far
+                break
 
-    for rule in ignore:
-        field_name = node.name.value
+            pop()
+            depth = frame.offset + frame.max_child_depth
+
+
+def compile_ignore_rules(
+    ignore: Optional[Iterable[IgnoreType]] = None,
+) -> Optional[Callable[[str], bool]]:
+    """
+    Returns a function that checks if a field name matches any of the ignore
+    rules, or None if there are no rules.
+
+    Rules are sorted by kind once, so that checking a field only needs a set
+    lookup for the string rules instead of going through each rule. The
+    common cases of no rules and of only string rules get a function that
+    doesn't check for the other kinds of rules at all.
+    """
+
+    names: Set[str] = set()
+    patterns: List[re.Pattern] = []
+    functions: List[Callable[[str], bool]] = []
+
+    for rule in ignore or []:
         if isinstance(rule, str):
-            if field_name == rule:
-                return True
+            names.add(rule)
         elif isinstance(rule, re.Pattern):
-            if rule.match(field_name):
-                return True
+            patterns.append(rule)
         elif callable(rule):
-            if rule(field_name):
-                return True
+            functions.append(rule)
         else:
             raise ValueError(f"Invalid ignore option: {rule}")
 
-    return False
+    if not patterns and not functions:
+        return frozenset(names).__contains__ if names else None
+
+    def should_ignore(field_name: str) -> bool:
+        return (
+            field_name in names
+            or any(pattern.match(field_name) for pattern in patterns)
+            or any(function(field_name) for function in functions)
+        )
+
+    return should_ignore
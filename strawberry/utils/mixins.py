@@ -1,9 +1,18 @@
+from functools import lru_cache
 from typing import Optional
 
 from strawberry.utils.str_converters import to_camel_case
 
 
+# Field and argument names are converted every time a schema is built and every
+# time arguments are converted, and the same names ("id", "name", ...) show up
+# over and over again, so we keep the conversions around.
+_cached_to_camel_case = lru_cache(maxsize=4096)(to_camel_case)
+
+
 class GraphQLNameMixin:
+    __slots__ = ()
+
     python_name: str
     graphql_name: Optional[str]
 
@@ -14,6 +23,6 @@ class GraphQLNameMixin:
         assert self.python_name
 
         if auto_camel_case:
-            return to_camel_case(self.python_name)
+            return _cached_to_camel_case(self.python_name)
 
         return self.python_name
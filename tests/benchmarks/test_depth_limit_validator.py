@@ -0,0 +1,59 @@
+from typing import List
+
+import pytest
+
+from graphql import parse, validate
+
+import strawberry
+from strawberry.schema import default_validation_rules
+from strawberry.tools import depth_limit_validator
+
+
+@strawberry.type
+class Person:
+    name: str
+    friends: List["Person"]
+
+
+@strawberry.type
+class Query:
+    people: List[Person]
+
+
+schema = strawberry.Schema(query=Query)
+
+
+def _create_query(fragments: int) -> str:
+    # each fragment spreads the previous one twice, so expanding the
+    # fragments would walk 2 ** fragments copies of the first one
+    definitions = ["fragment Friends0 on Person { name }"]
+
+    for i in range(1, fragments):
+        definitions.append(
+            f"fragment Friends{i} on Person "
+            f"{{ friends {{ ...Friends{i - 1} }} friends {{ ...Friends{i - 1} }} }}"
+        )
+
+    definitions.append(f"query {{ people {{ ...Friends{fragments - 1} }} }}")
+
+    return "\n".join(definitions)
+
+
+@pytest.mark.parametrize("fragments", [5, 10, 15])
+def test_depth_limit_validator(benchmark, fragments):
+    document = parse(_create_query(fragments))
+    rules = [depth_limit_validator(fragments + 1)]
+
+    errors = benchmark(validate, schema._schema, document, rules)
+
+    assert not errors
+
+
+@pytest.mark.parametrize("fragments", [5, 10, 15])
+def test_depth_limit_validator_with_default_rules(benchmark, fragments):
+    document = parse(_create_query(fragments))
+    rules = default_validation_rules + [depth_limit_validator(fragments + 1)]
+
+    errors = benchmark(validate, schema._schema, document, rules)
+
+    assert not errors
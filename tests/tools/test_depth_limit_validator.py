@@ -1,5 +1,6 @@
+import dataclasses
 import re
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 import pytest
 
@@ -215,6 +216,24 @@ def test_should_catch_query_thats_too_deep():
     assert errors[0].message == "'anonymous' exceeds maximum operation depth of 4"
 
 
+def test_should_report_one_error_per_operation():
+    query = """
+    query read1 {
+      user1 { pets { owner { address { city } } } }
+      user2 { pets { owner { address { city } } } }
+    }
+    query read2 {
+      user3 { pets { owner { address { city } } } }
+    }
+    """
+    errors, result = run_query(query, 3)
+
+    assert [error.message for error in errors] == [
+        "'read1' exceeds maximum operation depth of 3",
+        "'read2' exceeds maximum operation depth of 3",
+    ]
+
+
 def test_should_ignore_field():
     query = """
     query read1 {
@@ -242,6 +261,24 @@ def test_should_ignore_field():
     assert result == expected
 
 
+def test_should_ignore_field_by_name():
+    query = """
+    query read1 {
+      user { address { city } }
+    }
+    query read2 {
+      user1 { address { city } }
+      user2 { address { city } }
+    }
+    """
+
+    errors, result = run_query(query, 10, ignore=["user1", "user2"])
+
+    expected = {"read1": 2, "read2": 0}
+    assert not errors
+    assert result == expected
+
+
 def test_should_raise_invalid_ignore():
     query = """
     query read1 {
@@ -254,3 +291,101 @@ def test_should_raise_invalid_ignore():
             10,
             ignore=[True],
         )
+
+
+def test_should_catch_query_thats_too_deep_because_of_fragments():
+    query = """
+    query read1 {
+      user {
+        ...humanInfo
+      }
+    }
+    fragment humanInfo on Human {
+      pets {
+        ...petInfo
+      }
+    }
+    fragment petInfo on Pet {
+      owner {
+        address {
+          city
+        }
+      }
+    }
+    """
+    errors, result = run_query(query, 3)
+
+    assert len(errors) == 1
+    assert errors[0].message == "'read1' exceeds maximum operation depth of 3"
+
+
+def test_should_not_crash_on_fragment_cycles():
+    query = """
+    query read1 {
+      user {
+        ...humanInfo
+      }
+    }
+    fragment humanInfo on Human {
+      pets {
+        owner {
+          ...humanInfo
+        }
+      }
+    }
+    """
+    errors, result = run_query(query, 10)
+
+    assert len(errors) == 1
+    assert errors[0].message == "Cannot spread fragment 'humanInfo' within itself."
+    assert result == {"read1": 1}
+
+
+def test_should_reuse_validators_with_the_same_configuration():
+    ignore = ["user1", re.compile("user2")]
+
+    assert depth_limit_validator(3, ignore) is depth_limit_validator(3, list(ignore))
+    assert depth_limit_validator(3, ignore) is not depth_limit_validator(4, ignore)
+
+
+def test_should_accept_unhashable_callbacks():
+    @dataclasses.dataclass
+    class Recorder:
+        result: Optional[Dict[str, int]] = None
+
+        def __call__(self, query_depths: Dict[str, int]):
+            self.result = query_depths
+
+    recorder = Recorder()
+    document = parse("query read1 { user { name } }")
+
+    errors = validate(
+        schema._schema, document, [depth_limit_validator(3, None, recorder)]
+    )
+
+    assert not errors
+    assert recorder.result == {"read1": 1}
+
+
+def test_should_not_reuse_validators_with_equal_but_different_callbacks():
+    class Recorder:
+        def __init__(self):
+            self.result = None
+
+        def __call__(self, query_depths: Dict[str, int]):
+            self.result = query_depths
+
+        def __eq__(self, other: object) -> bool:
+            return isinstance(other, Recorder)
+
+        def __hash__(self) -> int:
+            return 0
+
+    first, second = Recorder(), Recorder()
+    document = parse("query read1 { user { name } }")
+
+    validate(schema._schema, document, [depth_limit_validator(3, None, first)])
+    validate(schema._schema, document, [depth_limit_validator(3, None, second)])
+
+    assert first.result == {"read1": 1}
+    assert second.result == {"read1": 1}